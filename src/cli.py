@@ -1,7 +1,8 @@
 # CLI module for Personal Cash Flow Simulator & Reporter
 import argparse
+import csv
 import datetime
-import re
+import functools
 from pathlib import Path
 import pandas as pd
 
@@ -14,6 +15,7 @@ from src.simulator import generate_simulation_report
 base_user_path = Path("./users")
 
 
+@functools.lru_cache(maxsize=1)
 def create_parser():
     parser = argparse.ArgumentParser(description="Personal Cash Flow Simulator & Reporter.")
 
@@ -32,6 +34,27 @@ def create_parser():
     return parser
 
 
+def _write_simulation_csv(sim_results_df, output_file):
+    """
+    Write simulation results to CSV with dates formatted as YYYY-MM-DD.
+    
+    Args:
+        sim_results_df (pandas.DataFrame): Day-by-day simulation results
+        output_file (Path): Path of the CSV file to write
+    """
+    # Format dates once from the datetime64 column, leaving the frame untouched
+    columns = [
+        sim_results_df[name].to_numpy().astype('datetime64[D]').astype(str) if name == 'date'
+        else sim_results_df[name].tolist()
+        for name in sim_results_df.columns
+    ]
+    
+    with open(output_file, 'w', newline='', buffering=1 << 16) as f:
+        writer = csv.writer(f)
+        writer.writerow(sim_results_df.columns)
+        writer.writerows(zip(*columns))
+
+
 def summarize_handler(args):
     """
     Handle the summarize command.
@@ -54,8 +77,12 @@ def summarize_handler(args):
     # Handle uncategorized transactions
     if not uncategorized_df.empty:
         print("\nWARNING: Uncategorized transactions found:")
-        for _, row in uncategorized_df.iterrows():
-            print(f"  {row['date']} | {row['description']} | Category: '{row['category']}'")
+        lines = (
+            "  " + pd.to_datetime(uncategorized_df['date']).dt.strftime('%Y-%m-%d').fillna('')
+            + " | " + uncategorized_df['description'].astype(str)
+            + " | Category: '" + uncategorized_df['category'].astype(str) + "'"
+        )
+        print("\n".join(lines.tolist()))
         
         # Save uncategorized transactions to CSV
         today_str = datetime.date.today().strftime('%Y%m%d')
@@ -73,6 +100,11 @@ def simulator_handler(args):
     """
     user_dir = base_user_path / args.user
     
+    # Dates used throughout the run
+    today = datetime.date.today()
+    today_str = today.strftime('%Y%m%d')
+    next_month_first = (today.replace(day=1) + datetime.timedelta(days=32)).replace(day=1)
+    
     try:
         # Load user data
         config = load_config(user_dir)
@@ -82,13 +114,10 @@ def simulator_handler(args):
         start_balance = float(config.get('current_balance', 0))
         target_balance = float(config.get('target_balance', 0))
         window_days = args.window
-        start_date = datetime.date.today()
-        
-        # Convert date strings to datetime objects
-        ledger_df['date'] = pd.to_datetime(ledger_df['date'])
+        start_date = today
         
         # Filter for forecast transactions
-        forecast_df = ledger_df[ledger_df['forecast'] == '1'].copy()
+        forecast_df = ledger_df[ledger_df['forecast'] == '1']
         
         # Generate the simulation report
         sim_results_df, recommended_transfer = generate_simulation_report(
@@ -103,30 +132,25 @@ def simulator_handler(args):
         alerts = sim_results_df[sim_results_df['alert_type'] == 'BELOW_TARGET']
         if not alerts.empty:
             print("\nALERTS:")
-            for _, alert in alerts.iterrows():
-                print(f"  {alert['date'].strftime('%Y-%m-%d')}: Balance drops to {alert['end_balance']:.2f} (below target of {target_balance:.2f})")
-                
-                # Check if there's a SYSTEM recommendation
-                if 'SYSTEM: Add funds' in alert['transactions_summary']:
-                    # Extract the amount from the transaction summary
-                    match = re.search(r'SYSTEM: Add funds \(([0-9.]+)\)', alert['transactions_summary'])
-                    if match:
-                        amount = float(match.group(1))
-                        print(f"    SYSTEM RECOMMENDATION: Add {amount:.2f} to reach target balance")
+            alert_lines = (
+                "  " + alerts['date'].dt.strftime('%Y-%m-%d')
+                + ": Balance drops to " + alerts['end_balance'].map('{:.2f}'.format)
+                + f" (below target of {target_balance:.2f})"
+            )
+            for alert_line, shortfall in zip(alert_lines, alerts['shortfall']):
+                print(alert_line)
+                print(f"    SYSTEM RECOMMENDATION: Add {shortfall:.2f} to reach target balance")
         
         # Print transfer recommendation
         if recommended_transfer > 0:
             print("\nSYSTEM_TRANSFER:")
             print(f"  Recommended Transfer: {recommended_transfer:.2f}")
-            print(f"  A virtual transfer has been added to the simulation on {(start_date.replace(day=1) + datetime.timedelta(days=32)).replace(day=1).strftime('%Y-%m-%d')}")
+            print(f"  A virtual transfer has been added to the simulation on {next_month_first.strftime('%Y-%m-%d')}")
         
         # Save simulation results to CSV
-        today_str = datetime.date.today().strftime('%Y%m%d')
         output_file = user_dir / f"simulation_output_{today_str}.csv"
         
-        # Convert date column to string for CSV output
-        sim_results_df['date'] = sim_results_df['date'].dt.strftime('%Y-%m-%d')
-        sim_results_df.to_csv(output_file, index=False)
+        _write_simulation_csv(sim_results_df, output_file)
         
         print(f"\nSimulation results saved to: {output_file}")
         
@@ -1,9 +1,76 @@
 # Data loader module for Personal Cash Flow Simulator & Reporter
-import yaml
+import json
+import os
+import tempfile
 import pandas as pd
 from pathlib import Path
 
 
+# Parsed config.yaml is cached as JSON next to it; JSON loads much faster than YAML
+CONFIG_CACHE_NAME = ".config.cache.json"
+
+
+def _read_config_cache(cache_path, source_key):
+    """
+    Read a cached config if it was built from the current config.yaml.
+    
+    Args:
+        cache_path (Path): Path to the JSON cache file
+        source_key (list): [mtime_ns, size] of config.yaml
+        
+    Returns:
+        dict or None: Cached configuration, or None if missing or stale
+    """
+    try:
+        with open(cache_path, 'r') as f:
+            cached = json.load(f)
+    except (OSError, ValueError):
+        return None
+    
+    if not isinstance(cached, dict) or cached.get('source') != source_key:
+        return None
+    return cached.get('config')
+
+
+def _write_config_cache(cache_path, source_key, config):
+    """
+    Write the parsed config to the JSON cache, ignoring failures.
+    
+    The cache is only written when the config survives a JSON round trip
+    unchanged, so cold and warm runs always return the same configuration.
+    
+    Args:
+        cache_path (Path): Path to the JSON cache file
+        source_key (list): [mtime_ns, size] of config.yaml
+        config (dict): Parsed configuration
+    """
+    try:
+        payload = json.dumps({'source': source_key, 'config': config})
+    except (TypeError, ValueError):
+        # Values JSON can't represent, e.g. YAML dates
+        return
+    if json.loads(payload)['config'] != config:
+        # JSON would change the config, e.g. integer keys come back as strings
+        return
+    
+    # Write to a temporary file and swap it in, so readers never see a
+    # partially written cache
+    try:
+        fd, tmp_path = tempfile.mkstemp(dir=cache_path.parent, prefix=cache_path.name, suffix='.tmp')
+    except OSError:
+        # Read-only directory
+        return
+    try:
+        with os.fdopen(fd, 'w') as f:
+            f.write(payload)
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+
+
 def load_config(user_dir):
     """
     Load user configuration from config.yaml
@@ -21,8 +88,23 @@ def load_config(user_dir):
     if not config_path.exists():
         raise FileNotFoundError(f"Config file not found: {config_path}")
     
+    # Reuse the cached parse while config.yaml is unchanged
+    stat = config_path.stat()
+    source_key = [stat.st_mtime_ns, stat.st_size]
+    cache_path = user_dir / CONFIG_CACHE_NAME
+    config = _read_config_cache(cache_path, source_key)
+    if config is not None:
+        return config
+    
+    # Only import PyYAML when the cache can't be used, and prefer the libyaml
+    # C loader when PyYAML was built with it
+    import yaml
+    loader = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+    
     with open(config_path, 'r') as f:
-        config = yaml.safe_load(f)
+        config = yaml.load(f, Loader=loader)
+    
+    _write_config_cache(cache_path, source_key, config)
     
     return config
 
@@ -44,12 +126,48 @@ def load_ledger(user_dir):
     if not ledger_path.exists():
         raise FileNotFoundError(f"Ledger file not found: {ledger_path}")
     
-    # Read CSV with explicit dtypes to avoid automatic parsing
-    # Keep empty strings as empty strings, not NaN
+    # Parse dates and amounts once at load time with the C parser so
+    # downstream code works on native datetime64/float64 columns.
+    # Blank dates and amounts load as NaT/NaN; every other empty string
+    # stays an empty string, not NaN
     ledger_df = pd.read_csv(
         ledger_path,
-        dtype=str,
-        keep_default_na=False
+        dtype={
+            'amount': 'float64',
+            'description': str,
+            'category': 'category',
+            'forecast': 'category',
+        },
+        parse_dates=['date'],
+        date_format='%Y-%m-%d',
+        engine='c',
+        keep_default_na=False,
+        na_values={'date': [''], 'amount': ['']}
     )
     
     return ledger_df
+
+
+def normalize_transactions(transactions_df):
+    """
+    Ensure the date and amount columns are datetime64 and float64.
+    
+    Frames from load_ledger are already typed and are returned unchanged;
+    frames built with string columns are converted once, without modifying
+    the caller's frame.
+    
+    Args:
+        transactions_df (pandas.DataFrame): Transaction ledger
+        
+    Returns:
+        pandas.DataFrame: Transaction ledger with typed date and amount columns
+    """
+    converted = {}
+    if not pd.api.types.is_datetime64_any_dtype(transactions_df['date']):
+        converted['date'] = pd.to_datetime(transactions_df['date'], cache=True)
+    if not pd.api.types.is_float_dtype(transactions_df['amount']):
+        converted['amount'] = pd.to_numeric(transactions_df['amount']).astype('float64')
+    
+    if not converted:
+        return transactions_df
+    return transactions_df.assign(**converted)
@@ -1,6 +1,73 @@
 # Summarize module for Personal Cash Flow Simulator & Reporter
 import pandas as pd
+import numpy as np
 import datetime
+import functools
+import collections
+import weakref
+
+from src.data_loader import normalize_transactions
+
+
+# Cash flow statement lines, in report order
+SUMMARY_LINES = (
+    'Revenue',
+    'Fixed Expenses',
+    'Variable Expenses',
+    'Profit Margin',
+    'Misc Income',
+    'Misc Expenses',
+    'Net Income',
+)
+
+# Cash flow statement line for each ledger category, and the sign forced onto
+# each description total (0 keeps the ledger sign as-is)
+SUMMARY_BUCKETS = {
+    'Revenue': 'Revenue',
+    'Fixed': 'Fixed Expenses',
+    'Variable': 'Variable Expenses',
+    'Misc Income': 'Misc Income',
+    'Misc Expense': 'Misc Expenses',
+}
+SUMMARY_SIGNS = {
+    'Revenue': 0,
+    'Fixed': -1,
+    'Variable': -1,
+    'Misc Income': 1,
+    'Misc Expense': -1,
+}
+
+# Most recent calculate_pnl results, keyed by (frame id, rows, month, categories)
+PNL_CACHE_SIZE = 64
+_pnl_cache = collections.OrderedDict()
+
+
+@functools.lru_cache(maxsize=16)
+def _category_index(valid_categories):
+    """
+    Build the lookup index of valid categories, once per distinct list.
+    
+    Args:
+        valid_categories (tuple): Valid category names
+        
+    Returns:
+        pandas.Index: Unique valid categories in their configured order
+    """
+    return pd.Index(list(dict.fromkeys(valid_categories)))
+
+
+def _category_codes(categories, valid_categories):
+    """
+    Map each category to its position in valid_categories.
+    
+    Args:
+        categories (array-like): Category of each transaction
+        valid_categories (list): List of valid category names
+        
+    Returns:
+        numpy.ndarray: Integer code per category, -1 where it is not valid
+    """
+    return _category_index(tuple(valid_categories)).get_indexer(categories)
 
 
 def find_uncategorized(transactions_df, valid_categories):
@@ -15,7 +82,7 @@ def find_uncategorized(transactions_df, valid_categories):
         pandas.DataFrame: Filtered DataFrame containing only uncategorized transactions
     """
     # Filter transactions where category is not in valid_categories
-    uncategorized_mask = ~transactions_df['category'].isin(valid_categories)
+    uncategorized_mask = _category_codes(transactions_df['category'], valid_categories) == -1
     return transactions_df[uncategorized_mask].copy()
 
 
@@ -23,6 +90,9 @@ def calculate_pnl(transactions_df, month_str, valid_categories):
     """
     Calculate profit and loss summary for a specific month.
     
+    Results are memoized per (ledger, month, categories); call
+    calculate_pnl.cache_clear() after mutating a ledger in place.
+    
     Args:
         transactions_df (pandas.DataFrame): Transaction ledger
         month_str (str): Month in YYYYMM format
@@ -31,67 +101,79 @@ def calculate_pnl(transactions_df, month_str, valid_categories):
     Returns:
         dict: Nested dictionary with P&L data by category and structured cash flow summary
     """
-    # Convert month_str to start and end dates
-    year = int(month_str[:4])
-    month = int(month_str[4:])
-    
-    # Create a copy of the DataFrame to avoid modifying the original
-    df = transactions_df.copy()
+    key = (id(transactions_df), len(transactions_df), month_str, tuple(valid_categories))
+    cached = _pnl_cache.get(key)
+    
+    # The id is only trusted while the cached frame is still alive, since ids
+    # of collected frames are reused
+    if cached is not None and cached[0]() is transactions_df:
+        _pnl_cache.move_to_end(key)
+        pnl = cached[1]
+    else:
+        pnl = _calculate_pnl(transactions_df, month_str, valid_categories)
+        _pnl_cache[key] = (weakref.ref(transactions_df), pnl)
+        if len(_pnl_cache) > PNL_CACHE_SIZE:
+            _pnl_cache.popitem(last=False)
     
-    # Convert date strings to datetime objects
-    df['date'] = pd.to_datetime(df['date'])
+    # Hand out a copy so callers cannot corrupt the cached result
+    return {category: dict(values) for category, values in pnl.items()}
+
+
+calculate_pnl.cache_clear = _pnl_cache.clear
+
+
+def _calculate_pnl(transactions_df, month_str, valid_categories):
+    """
+    Calculate profit and loss summary for a specific month, uncached.
     
-    # Filter for the specified month
-    start_date = pd.Timestamp(year=year, month=month, day=1)
-    if month == 12:
-        end_date = pd.Timestamp(year=year+1, month=1, day=1) - pd.Timedelta(days=1)
-    else:
-        end_date = pd.Timestamp(year=year, month=month+1, day=1) - pd.Timedelta(days=1)
+    Args:
+        transactions_df (pandas.DataFrame): Transaction ledger
+        month_str (str): Month in YYYYMM format
+        valid_categories (list): List of valid category names
+        
+    Returns:
+        dict: Nested dictionary with P&L data by category and structured cash flow summary
+    """
+    # Ensure typed date and amount columns (load_ledger already parses them);
+    # the caller's frame is never modified
+    df = normalize_transactions(transactions_df)
     
-    month_mask = (df['date'] >= start_date) & (df['date'] <= end_date)
-    month_df = df[month_mask]
+    # Filter for the specified month with a single comparison on month-truncated
+    # datetime64 values (integer months since the epoch)
+    target_month = np.datetime64(f"{month_str[:4]}-{month_str[4:]}", 'M')
+    month_df = df[df['date'].values.astype('datetime64[M]') == target_month]
     
     # Filter out uncategorized transactions
-    categorized_mask = month_df['category'].isin(valid_categories)
-    categorized_df = month_df[categorized_mask].copy()
-    
-    # Convert amount to numeric (using copy to avoid SettingWithCopyWarning)
-    categorized_df['amount'] = pd.to_numeric(categorized_df['amount'])
+    categorized_mask = _category_codes(month_df['category'], valid_categories) >= 0
+    categorized_df = month_df[categorized_mask]
     
     # Initialize result dictionary with categories and cash flow structure
     pnl = {category: {} for category in valid_categories}
-    pnl['summary'] = {
-        'Revenue': 0,
-        'Fixed Expenses': 0,
-        'Variable Expenses': 0,
-        'Profit Margin': 0,
-        'Misc Income': 0,
-        'Misc Expenses': 0,
-        'Net Income': 0
-    }
+    pnl['summary'] = dict.fromkeys(SUMMARY_LINES, 0)
     
     # If no transactions for the month, return the initialized dictionary
     if categorized_df.empty:
         return pnl
     
     # Group by category and description, sum amounts
-    grouped = categorized_df.groupby(['category', 'description'])['amount'].sum()
-    
-    # Populate the pnl dictionary
-    for (category, description), amount in grouped.items():
-        pnl[category][description] = amount
-        
-        # Update summary totals based on category
-        if category == 'Revenue':
-            pnl['summary']['Revenue'] += amount
-        elif category == 'Fixed':
-            pnl['summary']['Fixed Expenses'] += -abs(amount)  # Ensure negative
-        elif category == 'Variable':
-            pnl['summary']['Variable Expenses'] += -abs(amount)  # Ensure negative
-        elif category == 'Misc Income':
-            pnl['summary']['Misc Income'] += abs(amount)  # Ensure positive
-        elif category == 'Misc Expense':
-            pnl['summary']['Misc Expenses'] += -abs(amount)  # Ensure negative
+    grouped = categorized_df.groupby(['category', 'description'], observed=True)['amount'].sum()
+    
+    # Populate the per-category detail
+    for category, descriptions in grouped.groupby(level='category', observed=True):
+        pnl[category] = descriptions.droplevel('category').to_dict()
+    
+    # Update summary totals: force each description total to its category's
+    # sign, then sum them per category code with a dense bincount
+    category_index = _category_index(tuple(valid_categories))
+    sign_lut = np.array([SUMMARY_SIGNS.get(category, 0) for category in category_index], dtype=np.float64)
+    codes = category_index.get_indexer(grouped.index.get_level_values('category'))
+    amounts = grouped.to_numpy(dtype=np.float64)
+    signs = sign_lut[codes]
+    signed = np.where(signs == 0, amounts, signs * np.abs(amounts))
+    category_totals = np.bincount(codes, weights=signed, minlength=len(category_index))
+    for code, category in enumerate(category_index):
+        if category in SUMMARY_BUCKETS:
+            pnl['summary'][SUMMARY_BUCKETS[category]] = category_totals[code]
     
     # Calculate profit margin and net income
     pnl['summary']['Profit Margin'] = (
@@ -142,25 +224,17 @@ def format_pnl_output(pnl_data):
     Returns:
         str: Formatted P&L report
     """
-    output = []
-    output.append("CASH FLOW SUMMARY")
-    output.append("=" * 40)
+    output = ["CASH FLOW SUMMARY", "=" * 40]
     
     # Add categories and their transactions
-    for category in pnl_data:
-        if category != 'summary' and pnl_data[category]:
+    for category, descriptions in pnl_data.items():
+        if category != 'summary' and descriptions:
             output.append(f"\n{category}:")
-            for description, amount in pnl_data[category].items():
-                output.append(f"  {description}: {amount:.2f}")
+            output.extend(f"  {description}: {amount:.2f}" for description, amount in descriptions.items())
     
     # Add structured cash flow summary section
     output.append("\nCASH FLOW STATEMENT:")
-    output.append(f"  Revenue: {pnl_data['summary']['Revenue']:.2f}")
-    output.append(f"  Fixed Expenses: {pnl_data['summary']['Fixed Expenses']:.2f}")
-    output.append(f"  Variable Expenses: {pnl_data['summary']['Variable Expenses']:.2f}")
-    output.append(f"  Profit Margin: {pnl_data['summary']['Profit Margin']:.2f}")
-    output.append(f"  Misc Income: {pnl_data['summary']['Misc Income']:.2f}")
-    output.append(f"  Misc Expenses: {pnl_data['summary']['Misc Expenses']:.2f}")
-    output.append(f"  Net Income: {pnl_data['summary']['Net Income']:.2f}")
+    summary = pnl_data['summary']
+    output.extend(f"  {line}: {summary[line]:.2f}" for line in SUMMARY_LINES)
     
     return "\n".join(output)
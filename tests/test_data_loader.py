@@ -5,7 +5,7 @@ import os
 import yaml
 
 # Import the functions from src.data_loader
-from src.data_loader import load_config, load_ledger
+from src.data_loader import load_config, load_ledger, normalize_transactions
 
 # Use actual test directories
 TEST_USERS_DIR = Path("./users")
@@ -72,6 +72,28 @@ def test_load_ledger():
     assert len(ledger_df) == 2
     assert 'date' in ledger_df.columns
 
+def test_load_ledger_typed_columns(tmp_path):
+    with open(tmp_path / "ledger.csv", "w") as f:
+        f.write("date,amount,description,category,forecast\n")
+        f.write("2023-01-01,-100.00,Rent,Fixed,0\n")
+        f.write("2023-11-01,,Pending,,0\n")
+        f.write(",25.50,Refund,Revenue,1\n")
+    
+    ledger_df = load_ledger(tmp_path)
+    
+    assert pd.api.types.is_datetime64_any_dtype(ledger_df['date'])
+    assert ledger_df['amount'].dtype == 'float64'
+    assert isinstance(ledger_df['category'].dtype, pd.CategoricalDtype)
+    assert isinstance(ledger_df['forecast'].dtype, pd.CategoricalDtype)
+    
+    # Blank dates and amounts load as missing values instead of failing the load
+    assert ledger_df['amount'].iloc[0] == -100.00
+    assert pd.isna(ledger_df['amount'].iloc[1])
+    assert pd.isna(ledger_df['date'].iloc[2])
+    
+    # Other blank cells stay empty strings
+    assert ledger_df['category'].iloc[1] == ''
+
 def test_load_ledger_handles_empty():
     user_path = TEST_USERS_DIR / "empty_user"
     ledger_df = load_ledger(user_path)
@@ -86,3 +108,64 @@ def test_load_config_file_not_found():
 def test_load_ledger_file_not_found():
     with pytest.raises(FileNotFoundError):
         load_ledger(TEST_USERS_DIR / "non_existent_user")
+
+def test_load_config_writes_and_reuses_cache(tmp_path):
+    with open(tmp_path / "config.yaml", "w") as f:
+        yaml.dump({"current_balance": 1000.00, "categories": ["Revenue"]}, f)
+    
+    config = load_config(tmp_path)
+    cache_path = tmp_path / ".config.cache.json"
+    assert cache_path.exists()
+    
+    # A second load returns the cached config
+    assert load_config(tmp_path) == config
+
+def test_load_config_cache_invalidated_when_config_changes(tmp_path):
+    config_path = tmp_path / "config.yaml"
+    with open(config_path, "w") as f:
+        yaml.dump({"current_balance": 1000.00}, f)
+    load_config(tmp_path)
+    
+    with open(config_path, "w") as f:
+        yaml.dump({"current_balance": 2500.00, "target_balance": 500.00}, f)
+    
+    config = load_config(tmp_path)
+    assert config['current_balance'] == 2500.00
+    assert config['target_balance'] == 500.00
+
+def test_load_config_skips_cache_when_json_changes_config(tmp_path):
+    # Integer keys would come back as strings, dates can't be serialized
+    for name, text in [("int_keys", "limits:\n  1: 50\n"), ("dates", "review_date: 2024-01-31\n")]:
+        user_dir = tmp_path / name
+        user_dir.mkdir()
+        with open(user_dir / "config.yaml", "w") as f:
+            f.write(text)
+        
+        config = load_config(user_dir)
+        
+        # Nothing is cached, not even a partial file, and every load
+        # returns the YAML parse
+        assert list(user_dir.iterdir()) == [user_dir / "config.yaml"]
+        assert load_config(user_dir) == config
+    
+    assert load_config(tmp_path / "int_keys") == {'limits': {1: 50}}
+
+def test_normalize_transactions_converts_string_columns():
+    transactions = pd.DataFrame({
+        'date': ['2024-01-02', '2024-01-05'],
+        'amount': ['-1500.00', '2500.00'],
+        'description': ['Rent', 'Paycheck']
+    })
+    
+    normalized = normalize_transactions(transactions)
+    
+    assert pd.api.types.is_datetime64_any_dtype(normalized['date'])
+    assert normalized['amount'].dtype == 'float64'
+    assert list(normalized['amount']) == [-1500.00, 2500.00]
+    
+    # The caller's frame is left untouched
+    assert transactions['amount'][0] == '-1500.00'
+
+def test_normalize_transactions_returns_typed_ledger_unchanged():
+    ledger_df = load_ledger(TEST_USERS_DIR / "testuser")
+    assert normalize_transactions(ledger_df) is ledger_df
@@ -1,7 +1,8 @@
 import pytest
+import numpy as np
 import pandas as pd
 from datetime import date, timedelta
-from src.simulator import run_simulation_engine, calculate_intelligent_transfer
+from src.simulator import run_simulation_engine, calculate_intelligent_transfer, generate_simulation_report, run_simulation_batch
 
 
 @pytest.fixture
@@ -57,6 +58,29 @@ def test_run_simulation_engine_basic(sample_sim_transactions):
     assert day5['alert_type'] == 'OK'
 
 
+def test_run_simulation_engine_date_column_is_datetime64(sample_sim_transactions):
+    sim_results_df = run_simulation_engine(
+        2000.00, 1000.00, sample_sim_transactions, date(2024, 1, 1), 10
+    )
+
+    # Dates are a native datetime64 column at the baseline's second
+    # resolution, not boxed Timestamp/date objects
+    assert sim_results_df['date'].dtype == np.dtype('datetime64[s]')
+    assert list(sim_results_df['date']) == list(pd.date_range('2024-01-01', periods=10, freq='D'))
+
+
+def test_run_simulation_engine_shortfall_column(sample_sim_transactions):
+    sim_results_df = run_simulation_engine(
+        2000.00, 1000.00, sample_sim_transactions, date(2024, 1, 1), 10
+    )
+
+    # Shortfall is only set on days below target
+    assert sim_results_df.iloc[0]['shortfall'] == 0.0
+    assert sim_results_df.iloc[1]['shortfall'] == 500.00
+    assert 'SYSTEM: Add funds (500.00)' in sim_results_df.iloc[1]['transactions_summary']
+    assert (sim_results_df.loc[sim_results_df['alert_type'] == 'OK', 'shortfall'] == 0.0).all()
+
+
 def test_run_simulation_engine_multiple_transactions_same_day(sample_sim_transactions):
     start_date = date(2024, 1, 5)
     window_days = 1
@@ -80,6 +104,25 @@ def test_run_simulation_engine_multiple_transactions_same_day(sample_sim_transac
     assert 'Spotify: -50.00' in day1['transactions_summary']
 
 
+def test_run_simulation_engine_blank_amount():
+    data = {
+        'date': ['2024-01-02', '2024-01-03', '2024-01-03'],
+        'amount': ['-100.00', '', '50.00'],
+        'description': ['Rent', 'Pending', 'Refund'],
+        'category': ['Fixed', 'Fixed', 'Revenue'],
+        'forecast': ['1', '1', '1']
+    }
+    df = pd.DataFrame(data)
+    
+    sim_results_df = run_simulation_engine(1000.00, 950.00, df, date(2024, 1, 1), 4)
+    
+    # The blank amount adds nothing but still shows up in the day's summary
+    assert list(sim_results_df['end_balance']) == [1000.00, 900.00, 950.00, 950.00]
+    assert sim_results_df.iloc[2]['net_change'] == 50.00
+    assert sim_results_df.iloc[2]['transactions_summary'] == 'Pending: nan, Refund: 50.00'
+    assert sim_results_df.iloc[1]['alert_type'] == 'BELOW_TARGET'
+
+
 def test_run_simulation_engine_no_transactions():
     start_date = date(2024, 1, 1)
     window_days = 5
@@ -162,3 +205,109 @@ def test_calculate_intelligent_transfer_holdback_exceeds_surplus():
         month_end_balance, target_balance, future_30_day_balances
     )
     assert recommended_transfer == 0.0
+
+
+def test_generate_simulation_report_adds_surplus_transfer():
+    # Month-end balance is 7000 against a target of 2500 and the next days
+    # never dip below 4000, so the full 4500 surplus is transferred on Feb 1.
+    data = {
+        'date': ['2024-01-30', '2024-02-02'],
+        'amount': ['4000.00', '-3000.00'],
+        'description': ['Big Project', 'Rent'],
+        'category': ['Revenue', 'Fixed'],
+        'forecast': ['1', '1']
+    }
+    transactions = pd.DataFrame(data)
+    transactions['date'] = pd.to_datetime(transactions['date'])
+    
+    sim_results_df, recommended_transfer = generate_simulation_report(
+        3000.00, 2500.00, transactions, date(2024, 1, 30), 5
+    )
+
+    assert recommended_transfer == 4500.00
+    assert len(sim_results_df) == 5
+    
+    # Feb 1 carries the virtual transfer
+    transfer_day = sim_results_df.iloc[2]
+    assert transfer_day['date'] == pd.Timestamp(2024, 2, 1)
+    assert transfer_day['start_balance'] == 7000.00
+    assert transfer_day['net_change'] == -4500.00
+    assert transfer_day['end_balance'] == 2500.00
+    assert transfer_day['transactions_summary'] == 'Surplus Transfer: -4500.00'
+    assert transfer_day['alert_type'] == 'OK'
+    
+    # Later balances are lowered by the transfer and re-checked against target
+    rent_day = sim_results_df.iloc[3]
+    assert rent_day['start_balance'] == 2500.00
+    assert rent_day['end_balance'] == -500.00
+    assert rent_day['alert_type'] == 'BELOW_TARGET'
+    assert 'SYSTEM: Add funds (3000.00)' in rent_day['transactions_summary']
+
+
+def test_generate_simulation_report_no_transactions():
+    # With no forecast transactions the balance stays flat at 5000, so the
+    # month-end surplus of 3000 over target is still recommended for transfer.
+    empty_transactions = pd.DataFrame(columns=['date', 'amount', 'description', 'category', 'forecast'])
+    
+    sim_results_df, recommended_transfer = generate_simulation_report(
+        5000.00, 2000.00, empty_transactions, date(2024, 1, 30), 5
+    )
+
+    assert recommended_transfer == 3000.00
+    assert len(sim_results_df) == 5
+    assert list(sim_results_df['end_balance']) == [5000.00, 5000.00, 2000.00, 2000.00, 2000.00]
+    assert sim_results_df.iloc[2]['transactions_summary'] == 'Surplus Transfer: -3000.00'
+    assert (sim_results_df['alert_type'] == 'OK').all()
+
+
+def test_calculate_intelligent_transfer_accepts_ndarray():
+    # Same holdback case as above, with the look-ahead passed as an ndarray
+    future_30_day_balances = np.array([4000.0, 1500.0, 2000.0, 3500.0])
+    
+    recommended_transfer = calculate_intelligent_transfer(
+        5000.00, 2500.00, future_30_day_balances
+    )
+    assert recommended_transfer == 1500.00
+
+
+def test_run_simulation_batch_matches_engine(sample_sim_transactions):
+    start_date = date(2024, 1, 1)
+    window_days = 10
+    base = run_simulation_engine(2000.00, 1000.00, sample_sim_transactions, start_date, window_days)
+    
+    # Base scenario plus a stress scenario with every day's net change doubled
+    base_net = base['net_change'].to_numpy()
+    end_balances, below_target = run_simulation_batch(
+        [2000.00, 2000.00], 1000.00, np.vstack([base_net, base_net * 2])
+    )
+
+    assert end_balances.shape == (2, window_days)
+    assert list(end_balances[0]) == list(base['end_balance'])
+    assert list(below_target[0]) == list(base['alert_type'] == 'BELOW_TARGET')
+    assert end_balances[1][1] == -1000.00
+    assert below_target[1][1]
+
+
+def test_run_simulation_batch_shape_mismatch():
+    with pytest.raises(ValueError):
+        run_simulation_batch([1000.00, 2000.00], 500.00, np.zeros((3, 5)))
+
+
+def test_run_simulation_batch_uses_float32():
+    end_balances, below_target = run_simulation_batch([1000.00], 500.00, [[-250.25, -300.00, 100.50]])
+    
+    assert end_balances.dtype == np.float32
+    assert end_balances[0] == pytest.approx([749.75, 449.75, 550.25])
+    assert list(below_target[0]) == [False, True, False]
+
+
+def test_run_simulation_batch_rejects_balances_beyond_float32_range():
+    with pytest.raises(ValueError):
+        run_simulation_batch([2.0 ** 23 + 1], 0.0, np.zeros((1, 5)))
+
+
+def test_run_simulation_batch_rejects_running_balances_beyond_float32_range():
+    with pytest.raises(ValueError):
+        run_simulation_batch([2.0 ** 23 - 10], 0.0, [[5.0, 5.0, 5.0]])
+    with pytest.raises(ValueError):
+        run_simulation_batch([0.0], 0.0, [[-2.0 ** 23, -10.0]])
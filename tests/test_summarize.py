@@ -1,5 +1,7 @@
+import gc
 import pytest
 import pandas as pd
+import src.summarize
 from src.summarize import find_uncategorized, calculate_pnl, format_pnl_output
 
 
@@ -95,6 +97,60 @@ def test_calculate_pnl_with_misc_categories():
     assert pnl['summary']['Net Income'] == 870.00
 
 
+def test_calculate_pnl_cached(sample_transactions, valid_categories, mocker):
+    calculate_pnl.cache_clear()
+    spy = mocker.spy(src.summarize, '_calculate_pnl')
+    pnl = calculate_pnl(sample_transactions, '202312', valid_categories)
+    
+    # Mutating a returned result must not leak into later calls
+    pnl['Fixed']['Rent'] = 0
+    pnl['summary']['Net Income'] = 0
+    
+    # A repeat call is served from the cache
+    again = calculate_pnl(sample_transactions, '202312', valid_categories)
+    assert spy.call_count == 1
+    assert again['Fixed']['Rent'] == -1200.00
+    assert again['summary']['Net Income'] == 2000.00 - 1200.00 - 50.00
+    
+    # A different month of the same ledger is computed separately
+    january = calculate_pnl(sample_transactions, '202401', valid_categories)
+    assert spy.call_count == 2
+    assert january['Fixed']['Rent'] == -1200.00
+    assert january['Revenue'] == {}
+
+
+def test_calculate_pnl_cache_ignores_reused_frame_id(sample_transactions, valid_categories, mocker):
+    calculate_pnl.cache_clear()
+    old_df = sample_transactions.copy()
+    calculate_pnl(old_df, '202312', valid_categories)
+    old_key, old_entry = next(iter(src.summarize._pnl_cache.items()))
+    del old_df
+    gc.collect()
+    
+    # Simulate a new frame reusing the collected frame's id: its key now
+    # holds the old frame's result
+    new_df = sample_transactions.copy()
+    new_df.loc[0, 'amount'] = 3000.00
+    new_key = (id(new_df),) + old_key[1:]
+    src.summarize._pnl_cache[new_key] = old_entry
+    
+    spy = mocker.spy(src.summarize, '_calculate_pnl')
+    pnl = calculate_pnl(new_df, '202312', valid_categories)
+    assert spy.call_count == 1
+    assert pnl['Revenue']['Paycheck'] == 3000.00
+
+
+def test_calculate_pnl_cache_clear(sample_transactions, valid_categories):
+    calculate_pnl.cache_clear()
+    calculate_pnl(sample_transactions, '202312', valid_categories)
+    
+    # In-place edits are picked up once the cache is cleared
+    sample_transactions.loc[0, 'amount'] = 2500.00
+    calculate_pnl.cache_clear()
+    pnl = calculate_pnl(sample_transactions, '202312', valid_categories)
+    assert pnl['Revenue']['Paycheck'] == 2500.00
+
+
 def test_format_pnl_output():
     """Test the formatting of P&L output."""
     # Create a sample P&L data structure